@@ -2,6 +2,7 @@
 import pandas as pd
 import yfinance as yf
 from datetime import datetime
+from typing import Optional
 
 def _download_prices(ticker: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
     # Match notebook/SMA parity: no auto_adjust
@@ -27,9 +28,10 @@ def ema_strategy(
     long_window: int,
     take_profit: float,   # 0.20 -> 20%
     stop_loss: float,     # 0.05 -> 5%
+    prices: Optional[pd.DataFrame] = None,  # pre-downloaded OHLCV; skips the download
 ) -> pd.DataFrame:
 
-    df = _download_prices(ticker, start_date, end_date)
+    df = prices if prices is not None else _download_prices(ticker, start_date, end_date)
     if df.empty:
         return pd.DataFrame()
 
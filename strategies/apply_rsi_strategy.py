@@ -2,6 +2,7 @@
 import pandas as pd
 import yfinance as yf
 from datetime import datetime
+from typing import Optional
 
 def _download_prices(ticker: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
     # Keep parity with SMA/EMA: no auto_adjust
@@ -33,9 +34,10 @@ def rsi_strategy(
     take_profit: float,   # 0.20 for 20%
     stop_loss: float,     # 0.05 for 5%
     period: int = 14,
+    prices: Optional[pd.DataFrame] = None,  # pre-downloaded OHLCV; skips the download
 ) -> pd.DataFrame:
     
-    df = _download_prices(ticker, start_date, end_date)
+    df = prices if prices is not None else _download_prices(ticker, start_date, end_date)
     if df.empty:
         return pd.DataFrame()
 
@@ -1,6 +1,7 @@
 import pandas as pd
 import yfinance as yf
 from datetime import datetime
+from typing import Optional
 
 def _download_prices(ticker: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
     # Match the notebook: do NOT auto_adjust; flatten columns if needed
@@ -25,9 +26,10 @@ def sma_strategy(
     long_window: int,
     take_profit: float,   # e.g. 0.20 for 20%
     stop_loss: float,     # e.g. 0.05 for 5%
+    prices: Optional[pd.DataFrame] = None,  # pre-downloaded OHLCV; skips the download
 ) -> pd.DataFrame:
 
-    df = _download_prices(ticker, start_date, end_date)
+    df = prices if prices is not None else _download_prices(ticker, start_date, end_date)
     if df.empty:
         return pd.DataFrame()
 
@@ -1,12 +1,18 @@
 import sys
 import os
-from datetime import datetime, timedelta
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 import streamlit as st
 import time
+from functools import partial
 import yfinance as yf
 import pandas as pd
 import matplotlib.pyplot as plt
 import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 # Append the current directory so we can import from strategies/
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))      # streamlit_app/strategies
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # repo_root/strategies
@@ -21,6 +27,10 @@ ema_strategy = ema_module.ema_strategy
 import strategies.apply_rsi_strategy as rsi_module
 importlib.reload(rsi_module)
 rsi_strategy = rsi_module.rsi_strategy
+from precompute import (
+    precompute_keys, SMA_MAX_WINDOW, EMA_MAX_WINDOW, RSI_MAX,
+    RSI_OVERBOUGHT_MIN, RSI_OVERSOLD_MIN, RSI_MIN_GAP, TP_SL_MAX
+)
 
 
 
@@ -56,13 +66,203 @@ def _fmt_equity(equity_index: float) -> str:
     """1.00 -> 100.00% (+0.00% gain), 2.00 -> 200.00% (+100.00% gain)"""
     return f"{equity_index*100:.2f}% ({(equity_index-1)*100:+.2f}% gain)"
 
-def runTest(ticker, take_profit, stop_loss, sma_cfg=None, rsi_cfg=None, ema_cfg=None):
-    output = []
+#BACKGROUND PRECOMPUTE
+#Backtests for the current inputs (and their +/-1 neighbours) run on small
+#worker pools while the user is still editing, so "Run Tests" mostly just
+#collects finished results. Workers never touch st.* APIs: the shared state
+#is fetched in the script thread and handed to them.
+#Each session cancels its own queued jobs when its inputs change or when they
+#are evicted from its job cache, so it never has more than one input set's
+#worth queued (<= 4 current + 24 neighbours). Streamlit has no "session
+#ended" hook, so jobs left queued by a closed tab are skipped when a worker
+#picks them up instead; a job already running when the tab closes finishes.
+PRECOMPUTE_WORKERS = 2        # current inputs
+SPECULATIVE_WORKERS = 2       # +/-1 neighbours, never ahead of current inputs
+PRECOMPUTE_CACHE_SIZE = 128   # finished jobs kept per session
+PRICE_CACHE_SIZE = 8          # tickers kept in memory
+FAILED_PRICE_TTL = 60         # seconds before an empty/failed download is retried
+
+@st.cache_resource
+def _precompute_state():
+    """Process-wide worker pools and downloaded prices, shared by all sessions."""
+    return {
+        "pool": ThreadPoolExecutor(max_workers=PRECOMPUTE_WORKERS, thread_name_prefix="precompute"),
+        "speculative_pool": ThreadPoolExecutor(max_workers=SPECULATIVE_WORKERS, thread_name_prefix="speculative"),
+        "prices": OrderedDict(),  # (ticker, day) -> DataFrame
+        "failed": {},             # (ticker, day) -> time.monotonic() of the failed download
+        "downloading": {},        # (ticker, day) -> Lock held while that ticker downloads
+        "lock": threading.Lock(), # guards the three dicts above, never held across a download
+    }
 
-    start_date = datetime.today() - timedelta(days=365 * 5)
+def _backtest_window():
     end_date = datetime.today()
+    return end_date - timedelta(days=365 * 5), end_date
+
+def _cached_prices(state, key):
+    """Cached frame, an empty frame if the download failed recently, else None. Call under state["lock"]."""
+    if key in state["prices"]:
+        state["prices"].move_to_end(key)
+        return state["prices"][key]
+    failed_at = state["failed"].get(key)
+    if failed_at is not None and time.monotonic() - failed_at < FAILED_PRICE_TTL:
+        return pd.DataFrame()
+    return None
+
+def _load_prices(state, ticker):
+    """
+    Download the backtest window for ticker once per day and reuse it.
+    Only one download per ticker runs at a time; other tickers are not blocked.
+    Concurrent yf.download calls rely on yfinance>=1.0 (per-call state; 0.2.x
+    shared module globals), which requirements.txt pins.
+    The returned frame is shared by every job and session using this ticker:
+    callers must only read it (the strategies copy before adding columns).
+    """
+    key = (ticker, date.today())
+    with state["lock"]:
+        df = _cached_prices(state, key)
+        if df is not None:
+            return df
+        key_lock = state["downloading"].setdefault(key, threading.Lock())
+
+    with key_lock:
+        with state["lock"]:
+            df = _cached_prices(state, key)  # another thread may have just finished it
+            if df is not None:
+                return df
+        df = None
+        try:
+            start_date, end_date = _backtest_window()
+            df = sma_module._download_prices(ticker, start_date, end_date)
+        finally:
+            with state["lock"]:
+                state["downloading"].pop(key, None)
+                if df is None or df.empty:
+                    state["failed"][key] = time.monotonic()
+                else:
+                    state["failed"].pop(key, None)
+                    state["prices"][key] = df
+                    while len(state["prices"]) > PRICE_CACHE_SIZE:
+                        state["prices"].popitem(last=False)
+        return df
+
+def forget_failed_prices(ticker):
+    """An explicit Run click retries a ticker whose download recently failed."""
+    state = _precompute_state()
+    with state["lock"]:
+        state["failed"].pop((ticker, date.today()), None)
+
+def _run_strategy(state, name, ticker, cfg, take_profit, stop_loss):
+    """Runs one strategy on cached prices. take_profit/stop_loss are in %."""
+    prices = _load_prices(state, ticker)
+    if prices.empty:
+        return pd.DataFrame()  # same as the strategies' own no-data result
+    start_date, end_date = _backtest_window()
+    tp, sl = take_profit/100.0, stop_loss/100.0
+    if name == "sma":
+        return sma_strategy(ticker, start_date, end_date, cfg[0], cfg[1], tp, sl, prices=prices)
+    if name == "rsi":
+        return rsi_strategy(
+            ticker, start_date, end_date, cfg[0], cfg[1], tp, sl,
+            period=14,  # change if you expose this in UI later
+            prices=prices
+        )
+    return ema_strategy(ticker, start_date, end_date, cfg[0], cfg[1], tp, sl, prices=prices)
+
+def _session_alive_check():
+    """Script thread only: a callable telling workers whether this session is still connected."""
+    ctx = get_script_run_ctx()
+    if ctx is None or not runtime.exists():
+        return lambda: True
+    # Runtime.is_active_session is documented as safe to call from any thread
+    return partial(runtime.get_instance().is_active_session, ctx.session_id)
+
+def _unless_session_closed(is_alive, fn, *args):
+    if not is_alive():
+        return None  # tab closed while this sat in the queue
+    return fn(*args)
+
+def _skipped(fut):
+    # _unless_session_closed returns None; real jobs always return a DataFrame
+    return fut.done() and fut.exception() is None and fut.result() is None
+
+def _submit(state, pool_name, key, is_alive):
+    pool = state[pool_name]
+    _, name, ticker, cfg, take_profit, stop_loss = key
+    if name == "prices":
+        return pool.submit(_unless_session_closed, is_alive, _load_prices, state, ticker)
+    return pool.submit(_unless_session_closed, is_alive, _run_strategy,
+                       state, name, ticker, cfg, take_profit, stop_loss)
+
+def schedule_precompute(ticker, take_profit, stop_loss, cfgs):
+    """
+    Called on every rerun. Cancels this session's queued jobs whose inputs are
+    no longer current or adjacent, then queues anything missing: current inputs
+    on the main pool, neighbours on the speculative pool. Running jobs are left
+    to finish, and finished ones (even empty/failed) are not resubmitted here.
+    """
+    state = _precompute_state()
+    is_alive = _session_alive_check()
+    jobs = st.session_state.setdefault("precompute_jobs", OrderedDict())  # key -> (Future, speculative)
+    current, nearby = precompute_keys(date.today(), ticker, take_profit, stop_loss, cfgs)
+    wanted = set(current) | set(nearby)
+
+    for key, (fut, _) in list(jobs.items()):
+        if key not in wanted and fut.cancel():
+            del jobs[key]
+
+    for key in current:
+        fut, speculative = jobs.get(key, (None, False))
+        # a neighbour that became current moves to the main pool if it hasn't started
+        if fut is None or fut.cancelled() or _skipped(fut) or (speculative and fut.cancel()):
+            jobs[key] = (_submit(state, "pool", key, is_alive), False)
+        jobs.move_to_end(key)
+
+    for key in nearby:
+        fut, _ = jobs.get(key, (None, True))
+        if fut is None or fut.cancelled() or _skipped(fut):
+            jobs[key] = (_submit(state, "speculative_pool", key, is_alive), True)
+        jobs.move_to_end(key)
+
+    # oldest entries are never wanted, which always sits at the end
+    while len(jobs) > PRECOMPUTE_CACHE_SIZE:
+        _, (fut, _) = jobs.popitem(last=False)
+        fut.cancel()
+
+def _strategy_result(name, ticker, cfg, take_profit, stop_loss):
+    """
+    Result of the precomputed backtest. Waits only for a job that is already
+    running; one still queued (or never queued, or failed) runs right here.
+    """
+    state = _precompute_state()
+    jobs = st.session_state.setdefault("precompute_jobs", OrderedDict())
+    key = (date.today(), name, ticker, cfg, take_profit, stop_loss)
+    fut, _ = jobs.get(key, (None, False))
+    if fut is not None and not fut.cancel():
+        try:
+            df = fut.result()
+            if df is not None and not df.empty:
+                return df
+        except Exception:
+            pass  # retried below so the error surfaces from this thread
+
+    df = _run_strategy(state, name, ticker, cfg, take_profit, stop_loss)
+    fut = Future()
+    fut.set_result(df)
+    jobs[key] = (fut, False)
+    return df
+
+@st.cache_data(show_spinner=False, max_entries=PRICE_CACHE_SIZE)
+def _lookup_name(ticker):
+    # .info is a network round trip; don't repeat it on every widget change
+    ticker_info = yf.Ticker(ticker).info
+    return ticker_info.get('shortName') or ticker_info.get('longName') or "Unknown Company"
+
+def runTest(ticker, take_profit, stop_loss, sma_cfg=None, rsi_cfg=None, ema_cfg=None):
+    output = []
 
-    successful("Running backtest with current configuration")
+    # Quick notice instead of successful(): its 1s sleep would dominate now
+    # that results are usually precomputed
+    st.toast("Running backtest with current configuration")
 
     output += [
         f"# Ticker selected: {ticker}",
@@ -76,32 +276,10 @@ def runTest(ticker, take_profit, stop_loss, sma_cfg=None, rsi_cfg=None, ema_cfg=
 
     output.append(f"## **Strategy Results:**")
 
-    # Run individual strategies 
-    df_sma = None
-    if sma_cfg:
-        short_w, long_w = sma_cfg
-        df_sma = sma_strategy(
-            ticker, start_date, end_date, short_w, long_w,
-            take_profit/100.0, stop_loss/100.0
-        )
-
-    df_rsi = None
-    if rsi_cfg:
-        r_overbought, r_oversold = rsi_cfg
-        df_rsi = rsi_strategy(
-            ticker, start_date, end_date,
-            r_overbought, r_oversold,
-            take_profit/100.0, stop_loss/100.0,
-            period=14  # change if you expose this in UI later
-    )
-
-    df_ema = None
-    if ema_cfg:
-        e_short, e_long = ema_cfg
-        df_ema = ema_strategy(
-            ticker, start_date, end_date, e_short, e_long,
-            take_profit/100.0, stop_loss/100.0
-    )
+    # Collect individual strategies (normally already finished in the background)
+    df_sma = _strategy_result("sma", ticker, sma_cfg, take_profit, stop_loss) if sma_cfg else None
+    df_rsi = _strategy_result("rsi", ticker, rsi_cfg, take_profit, stop_loss) if rsi_cfg else None
+    df_ema = _strategy_result("ema", ticker, ema_cfg, take_profit, stop_loss) if ema_cfg else None
 
     # Choose reference series (Close)
     ref = df_sma if df_sma is not None else (df_rsi if df_rsi is not None else df_ema)
@@ -328,8 +506,7 @@ with tabs[1]:
 
         # try pulling the full company name using yfinance
         try:
-            ticker_info = yf.Ticker(resolved_ticker).info
-            full_name = ticker_info.get('shortName') or ticker_info.get('longName') or "Unknown Company"
+            full_name = _lookup_name(resolved_ticker)
             #successful(f"✅ Selected Ticker: {resolved_ticker}",location = 'sidebar')
             st.sidebar.write(f"Full Name: **{full_name}**")
         except:
@@ -339,8 +516,8 @@ with tabs[1]:
 
     #TP/SL INPUTS
     st.sidebar.write("Select Desired Take Profit and Stop Loss Levels (%): ")
-    stop_loss = st.sidebar.number_input("Stop Loss: ", min_value=0, max_value=100, step = 1, value = 5)
-    take_profit = st.sidebar.number_input("Take Profit: ", min_value= stop_loss + 1, max_value=100, step = 1, value = 10)
+    stop_loss = st.sidebar.number_input("Stop Loss: ", min_value=0, max_value=TP_SL_MAX, step = 1, value = 5)
+    take_profit = st.sidebar.number_input("Take Profit: ", min_value= stop_loss + 1, max_value=TP_SL_MAX, step = 1, value = 10)
 
     #SIDEBAR STRATEGY SELECTION
     st.sidebar.markdown("# Select strategy(s) you would like to use")
@@ -348,24 +525,31 @@ with tabs[1]:
     if sma:
         #st.sidebar.write("Select Configurations")
         st.sidebar.markdown("## Choose Short Moving Average Periods: Popular Choice is SMA(20/50)")
-        sma_short_window = st.sidebar.number_input("Short Moving Average (Recommended 20+)", min_value=1, max_value=200, value=20, step = 1)
-        sma_long_window = st.sidebar.number_input("Long Moving Average (Recommended 50+)", min_value = sma_short_window + 1, max_value=200, value=50, step = 1)
+        sma_short_window = st.sidebar.number_input("Short Moving Average (Recommended 20+)", min_value=1, max_value=SMA_MAX_WINDOW, value=20, step = 1)
+        sma_long_window = st.sidebar.number_input("Long Moving Average (Recommended 50+)", min_value = sma_short_window + 1, max_value=SMA_MAX_WINDOW, value=50, step = 1)
 
     rsi = st.sidebar.checkbox("RSI Strategy")
     if rsi:
-        min_gap = 10
+        min_gap = RSI_MIN_GAP
         #st.sidebar.write("Select Configurations")
         st.sidebar.markdown("## Choose Over bought/sold threshholds: Popular Choice is 70 and 30)")
-        rsi_overbought = st.sidebar.number_input("Overbought threshold(Recommended at least 60)", min_value = 50, max_value=100, value=70, step = 1)
+        rsi_overbought = st.sidebar.number_input("Overbought threshold(Recommended at least 60)", min_value = RSI_OVERBOUGHT_MIN, max_value=RSI_MAX, value=70, step = 1)
         max_oversold = rsi_overbought - min_gap
-        rsi_oversold = st.sidebar.number_input("Long Moving Average (Recommended at most 40)", min_value = 10, max_value= max_oversold, value=30, step = 1)
+        rsi_oversold = st.sidebar.number_input("Long Moving Average (Recommended at most 40)", min_value = RSI_OVERSOLD_MIN, max_value= max_oversold, value=30, step = 1)
         rsi_period = st.sidebar.number_input("RSI Period:", min_value=1, max_value=100, value=20, step = 1)
 
     ema = st.sidebar.checkbox("EMA Strategy")
     if ema:
         st.sidebar.markdown("## Choose the Short and Long moving averages: ")
-        ema_short_window = st.sidebar.number_input("Short Moving Average: Recommended 10-20", min_value = 1, max_value=100, value = 10, step = 1)
-        ema_long_window = st.sidebar.number_input("Long Moving Average: Recommended 2 - 2.5x of short window", min_value = ema_short_window + 1, max_value=100, value = 30, step = 1)
+        ema_short_window = st.sidebar.number_input("Short Moving Average: Recommended 10-20", min_value = 1, max_value=EMA_MAX_WINDOW, value = 10, step = 1)
+        ema_long_window = st.sidebar.number_input("Long Moving Average: Recommended 2 - 2.5x of short window", min_value = ema_short_window + 1, max_value=EMA_MAX_WINDOW, value = 30, step = 1)
+
+    sma_cfg = (sma_short_window, sma_long_window) if sma else None
+    rsi_cfg = (rsi_overbought, rsi_oversold) if rsi else None
+    ema_cfg = (ema_short_window, ema_long_window) if ema else None
+
+    # START BACKGROUND WORK FOR THESE INPUTS (AND NEARBY ONES) BEFORE RUN IS CLICKED
+    schedule_precompute(resolved_ticker, take_profit, stop_loss, {"sma": sma_cfg, "rsi": rsi_cfg, "ema": ema_cfg})
 
     #LINKS TO BACKTESTING BUTTON --> RUNS CONFIGS USER HAS
     # RUN TESTS IF TRIGGERED
@@ -373,10 +557,7 @@ with tabs[1]:
         if not resolved_ticker or not any([sma, rsi, ema]):
             st.error("Please enter a valid ticker and select at least one strategy.")
         else:
-            sma_cfg = (sma_short_window, sma_long_window) if sma else None
-            rsi_cfg = (rsi_overbought, rsi_oversold) if rsi else None
-            ema_cfg = (ema_short_window, ema_long_window) if ema else None
-
+            forget_failed_prices(resolved_ticker)
             st.session_state["backtest_output"] = runTest(
                 resolved_ticker,
                 take_profit,
@@ -0,0 +1,80 @@
+# streamlit_app/precompute.py
+# Pure helpers deciding which backtests app.py runs ahead of "Run Tests".
+# No Streamlit/pandas imports so they can be checked on their own:
+#   python -m doctest streamlit_app/precompute.py
+
+# Sidebar widget bounds; app.py's number_inputs are built from these
+SMA_MAX_WINDOW = 200
+EMA_MAX_WINDOW = 100
+RSI_MAX = 100
+RSI_OVERBOUGHT_MIN = 50
+RSI_OVERSOLD_MIN = 10
+RSI_MIN_GAP = 10
+TP_SL_MAX = 100
+
+def valid_cfg(name, cfg):
+    """
+    Mirrors the sidebar number_input bounds for one strategy config.
+
+    >>> valid_cfg("sma", (20, 50)), valid_cfg("sma", (50, 50)), valid_cfg("sma", (0, 50))
+    (True, False, False)
+    >>> valid_cfg("ema", (10, 100)), valid_cfg("ema", (10, 101))
+    (True, False)
+    >>> valid_cfg("rsi", (70, 30)), valid_cfg("rsi", (50, 41)), valid_cfg("rsi", (70, 9))
+    (True, False, False)
+    """
+    a, b = cfg
+    if name == "sma":
+        return 1 <= a < b <= SMA_MAX_WINDOW
+    if name == "ema":
+        return 1 <= a < b <= EMA_MAX_WINDOW
+    return RSI_OVERBOUGHT_MIN <= a <= RSI_MAX and RSI_OVERSOLD_MIN <= b <= a - RSI_MIN_GAP
+
+def valid_tp_sl(take_profit, stop_loss):
+    """
+    Stop loss 0-100, take profit above it and at most 100.
+
+    >>> valid_tp_sl(10, 5), valid_tp_sl(5, 5), valid_tp_sl(10, -1)
+    (True, False, False)
+    """
+    return 0 <= stop_loss < take_profit <= TP_SL_MAX
+
+def precompute_keys(day, ticker, take_profit, stop_loss, cfgs):
+    """
+    Returns (current, nearby) job keys. Keys are (day, name, ticker, cfg, tp, sl);
+    name "prices" is a plain download. current is what "Run Tests" would need
+    right now, nearby is every single +/-1 step on a window/threshold or on TP/SL
+    that the sidebar would accept.
+
+    >>> cur, near = precompute_keys("d", "SPY", 10, 5, {"sma": (1, 2), "rsi": None})
+    >>> cur
+    [('d', 'prices', 'SPY', None, None, None), ('d', 'sma', 'SPY', (1, 2), 10, 5)]
+    >>> [k[3:] for k in near]
+    [((1, 3), 10, 5), ((1, 2), 11, 5), ((1, 2), 9, 5), ((1, 2), 10, 6), ((1, 2), 10, 4)]
+    >>> precompute_keys("d", "SPY", 6, 5, {"ema": (10, 30)})[1][-2:]  # TP 5 / SL 6 skipped
+    [('d', 'ema', 'SPY', (10, 30), 7, 5), ('d', 'ema', 'SPY', (10, 30), 6, 4)]
+    >>> precompute_keys("d", None, 10, 5, {"sma": (20, 50)})
+    ([], [])
+    """
+    if not ticker:
+        return [], []
+    selected = {name: cfg for name, cfg in cfgs.items() if cfg}
+    current = [(day, "prices", ticker, None, None, None)]
+    current += [(day, name, ticker, cfg, take_profit, stop_loss) for name, cfg in selected.items()]
+
+    nearby = []
+    for name, cfg in selected.items():
+        for i in range(len(cfg)):
+            for step in (-1, 1):
+                stepped = list(cfg)
+                stepped[i] += step
+                stepped = tuple(stepped)
+                if valid_cfg(name, stepped):
+                    nearby.append((day, name, ticker, stepped, take_profit, stop_loss))
+
+    for tp, sl in ((take_profit + 1, stop_loss), (take_profit - 1, stop_loss),
+                   (take_profit, stop_loss + 1), (take_profit, stop_loss - 1)):
+        if valid_tp_sl(tp, sl):
+            for name, cfg in selected.items():
+                nearby.append((day, name, ticker, cfg, tp, sl))
+    return current, list(dict.fromkeys(nearby))